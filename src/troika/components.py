@@ -1,7 +1,45 @@
 """Component discovery utilities"""
 
+import functools
 from importlib.metadata import entry_points
 
+#: Components already loaded, indexed by (group, name)
+_loaded = {}
+
+
+@functools.lru_cache(maxsize=None)
+def get_group(group):
+    """List the entry points declared in a group
+
+    The result is cached, call ``get_group.cache_clear()`` to rescan.
+
+    Parameters
+    ----------
+    group: str
+        Name of the entry point group, e.g. "troika.controllers"
+
+    Returns
+    -------
+    dict[str, `importlib.metadata.EntryPoint`]
+        Entry points indexed by name. If a name is declared several times,
+        the first declaration is kept
+
+    Raises
+    ------
+    KeyError
+        If `group` is not found
+    """
+    try:
+        declared = entry_points(group=group)
+    except TypeError:  # Python < 3.10
+        declared = entry_points().get(group, ())
+    if not declared:
+        raise KeyError(group)
+    found = {}
+    for comp in declared:
+        found.setdefault(comp.name, comp)
+    return found
+
 
 def get_entrypoint(group, name):
     """Load a component from a declared entry point
@@ -25,8 +63,21 @@ def get_entrypoint(group, name):
     ValueError
         If `name` is not found in `group`
     """
-    components = entry_points()[group]
-    found = [comp for comp in components if comp.name == name]
-    if not found:
+    try:
+        return _loaded[group, name]
+    except KeyError:
+        pass
+    components = get_group(group)
+    try:
+        entry = components[name]
+    except KeyError:
         raise ValueError(f"Component {name!r} not found in group {group!r}")
-    return found[0].load()
+    comp = entry.load()
+    _loaded[group, name] = comp
+    return comp
+
+
+def clear_cache():
+    """Forget the entry points and components loaded so far"""
+    _loaded.clear()
+    get_group.cache_clear()
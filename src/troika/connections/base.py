@@ -1,6 +1,7 @@
 """Base connection class"""
 
 import logging
+import subprocess
 
 from ..connection import PIPE
 
@@ -65,7 +66,7 @@ class Connection:
         ----------
         command: list of str or path-like
             Command to execute, as a list of arguments
-        stdin: None, PIPE or file-like
+        stdin: None, PIPE, file descriptor or file-like
             Standard input, /dev/null if None
         stdout: None, PIPE or file-like
             Standard output, /dev/null if None
@@ -147,7 +148,13 @@ class Connection:
         )
         if dryrun:
             return True
-        proc_stdout, proc_stderr = proc.communicate()
+        try:
+            proc_stdout, proc_stderr = proc.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.communicate()
+            _logger.error("Connection check timed out after %s seconds", timeout)
+            return False
         retcode = proc.returncode
         if proc.returncode == 0:
             log = _logger.debug
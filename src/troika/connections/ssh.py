@@ -39,6 +39,19 @@ class SSHConnection(Connection):
         if connect_timeout is not None:
             self.ssh_options.append(f"-oConnectTimeout={connect_timeout}")
             self.scp_options.append(f"-oConnectTimeout={connect_timeout}")
+        control_persist = config.get("ssh_control_persist", None)
+        if control_persist is not None:
+            control_path = config.get(
+                "ssh_control_path", "~/.ssh/troika-control-%r@%h:%p"
+            )
+            for opts in (self.ssh_options, self.scp_options):
+                opts.extend(
+                    [
+                        "-oControlMaster=auto",
+                        f"-oControlPath={control_path}",
+                        f"-oControlPersist={control_persist}",
+                    ]
+                )
         self.host = config["host"]
         if self.user is None:
             self.user = config.get("user", None)
@@ -108,22 +121,7 @@ class SSHConnection(Connection):
             scp_args.append(f"{self.host}:{dst}")
         else:
             scp_args.append(f"{self.user}@{self.host}:{dst}")
-        proc = self.parent.execute(scp_args, stdout=PIPE, stderr=PIPE, dryrun=dryrun)
-        if dryrun:
-            return
-        proc_stdout, proc_stderr = proc.communicate()
-        proc_stdout = proc_stdout.strip()
-        proc_stderr = proc_stderr.strip()
-        retcode = proc.wait()
-        if proc_stdout:
-            _logger.debug("scp output: %s", proc_stdout)
-        if retcode != 0:
-            if proc_stderr:
-                _logger.error("scp error: %s", proc_stderr)
-        else:
-            if proc_stderr:
-                _logger.debug("scp error output: %s", proc_stderr)
-        check_retcode(retcode, what="Copy")
+        self._run_scp(scp_args, dryrun=dryrun)
 
     def getfile(self, src, dst, dryrun=False):
         """See `Connection.getfile`"""
@@ -139,6 +137,10 @@ class SSHConnection(Connection):
         else:
             scp_args.append(f"{self.user}@{self.host}:{src}")
         scp_args.append(dst)
+        self._run_scp(scp_args, dryrun=dryrun)
+
+    def _run_scp(self, scp_args, dryrun=False):
+        """Run a ``scp`` command and check its result"""
         proc = self.parent.execute(scp_args, stdout=PIPE, stderr=PIPE, dryrun=dryrun)
         if dryrun:
             return
@@ -1,5 +1,6 @@
 """Base controller class"""
 
+import io
 import logging
 import os
 import pathlib
@@ -9,10 +10,25 @@ import tempfile
 from .. import ConfigurationError, InvocationError, RunError, hook, site
 from ..directives import ALIASES, translators
 from ..generator import Generator
-from ..parser import DirectiveParser, MultiParser, ParseError, ShebangParser
+from ..parser import (
+    DirectiveParser,
+    MultiParser,
+    ParseError,
+    ShebangParser,
+    save_directives,
+)
+from ..utils import append_suffix
 
 _logger = logging.getLogger(__name__)
 
+#: Read buffer size used when parsing scripts. Larger than the default to
+#: reduce the number of read() calls on networked file systems; this makes
+#: little difference for local or in-memory (tmpfs) files.
+PARSE_BUFFER_SIZE = 64 * 1024
+
+#: Block size used when copying the script body to the generated script
+COPY_BUFFER_SIZE = 1024 * 1024
+
 
 class Controller:
     """Main controller
@@ -37,6 +53,8 @@ class Controller:
         self.default_shebang = None
         self.unknown_directive = "warn"
         self.script_data = {}
+        self.script_directives = {}
+        self.cache_directives = False
 
     def __repr__(self):
         """Return a printable representation"""
@@ -66,6 +84,7 @@ class Controller:
         with self.action_context(parse_script=script) as context:
             pp_script = self.generate_script(script, user, output)
             hook.pre_submit(self.site, script, output, dryrun)
+            self.site.wait_connection_check()
             self.site.submit(pp_script, user, output, dryrun)
         return context.status
 
@@ -218,6 +237,10 @@ class Controller:
             raise SystemExit(1)
         self.default_shebang = self.site.config.get("default_shebang", None)
         self.unknown_directive = self.site.config.get("unknown_directive", "warn")
+        # Only abort_on_ecflow reads the saved directives back
+        self.cache_directives = "abort_on_ecflow" in self.site.config.get(
+            "post_kill", []
+        )
 
     def teardown(self, sts=0):
         """Tear down the controller
@@ -247,6 +270,7 @@ class Controller:
         body = self.run_parser(script, parser)
         self.script_data.update(parser.data)
         self.script_data["body"] = body
+        self.script_directives = self.script_data["directives"].copy()
         dir_defines = getattr(self.args, "define", [])
         dir_overrides = dir_parser.parse_directive_args(dir_defines)
         self.script_data["directives"].update(dir_overrides)
@@ -266,20 +290,18 @@ class Controller:
         file-like
             Script body
         """
-        script = pathlib.Path(script)
-        stmp = tempfile.SpooledTemporaryFile(
-            max_size=1024**3, mode="w+b", dir=script.parent, prefix=script.name
-        )
-        with open(script, "rb") as sin:
+        script = os.fspath(script)
+        feed = parser.feed
+        body = []
+        keep = body.append
+        with open(script, "rb", buffering=PARSE_BUFFER_SIZE) as sin:
             try:
                 for lineno, line in enumerate(sin, start=1):
-                    drop = parser.feed(line)
-                    if not drop:
-                        stmp.write(line)
+                    if not feed(line):
+                        keep(line)
             except ParseError as e:
                 raise ParseError(f"in {script!s}, line {lineno} {e!s}") from e
-        stmp.seek(0)
-        return stmp
+        return io.BytesIO(b"".join(body))
 
     def generate_script(self, script, user, output):
         """Generate the post-processed script
@@ -327,23 +349,35 @@ class Controller:
             Path to the generated script file
         """
         script = pathlib.Path(script)
-        orig_script = script.with_suffix(script.suffix + ".orig")
+        orig_script = append_suffix(script, ".orig")
         if orig_script.exists():
             _logger.warning(
                 "Backup script file %r already exists, " + "overwriting",
                 str(orig_script),
             )
-        with tempfile.NamedTemporaryFile(
-            mode="w+b", delete=False, dir=script.parent, prefix=script.name
-        ) as sout:
-            sout.writelines(generator.generate(self.script_data))
-            for line in self.script_data["body"]:
-                sout.write(line)
-            new_script = pathlib.Path(sout.name)
-        shutil.copymode(script, new_script)
-        shutil.copy2(script, orig_script)
+        new_script = None
+        try:
+            with tempfile.NamedTemporaryFile(
+                mode="w+b", delete=False, dir=script.parent, prefix=script.name
+            ) as sout:
+                new_script = pathlib.Path(sout.name)
+                sout.writelines(generator.generate(self.script_data))
+                shutil.copyfileobj(self.script_data["body"], sout, COPY_BUFFER_SIZE)
+            shutil.copymode(script, new_script)
+        except BaseException:
+            if new_script is not None:
+                new_script.unlink()
+            raise
+        # The script is missing between these two renames, keep them adjacent
+        script.replace(orig_script)
         new_script.replace(script)
         _logger.debug("Script generated. Original script saved to %r", str(orig_script))
+        if self.cache_directives:
+            saved = append_suffix(orig_script, ".directives")
+            try:
+                save_directives(saved, self.script_directives)
+            except OSError as e:
+                _logger.warning("Could not save directives to %r: %s", str(saved), e)
         return script
 
     def _get_site(self):
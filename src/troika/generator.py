@@ -12,6 +12,58 @@ def ignore(value):
     return None
 
 
+def compile_translation(fmt):
+    """Turn a directive translation into a function returning a list of lines
+
+    Parameters
+    ----------
+    fmt: bytes or callable
+        Directive translation, see `Generator`
+
+    Returns
+    -------
+    callable
+        Function taking the value of the directive and returning a list of
+        byte strings (possibly empty)
+
+    >>> compile_translation(b"-q %s")(b"normal")
+    [b'-q normal']
+    >>> compile_translation(b"-l h_rt=%s,s_rt=%s")((b"1:00", b"0:55"))
+    [b'-l h_rt=1:00,s_rt=0:55']
+    >>> compile_translation(ignore)(b"anything")
+    []
+    >>> compile_translation(lambda value: b"-x" + value)(b"y")
+    [b'-xy']
+    """
+    if isinstance(fmt, bytes):
+        prefix = fmt[:-2]
+        if fmt.endswith(b"%s") and b"%" not in prefix:
+            # Common case of a single trailing placeholder: concatenate
+            # instead of parsing the format on every call
+
+            def translate(arg):
+                if isinstance(arg, bytes):
+                    return [prefix + arg]
+                return [fmt % arg]
+
+        else:
+
+            def translate(arg):
+                return [fmt % arg]
+
+    else:
+
+        def translate(arg):
+            directives = fmt(arg)
+            if directives is None:
+                return []
+            if isinstance(directives, bytes):
+                return [directives]
+            return directives
+
+    return translate
+
+
 class Generator:
     """Base script header generator
 
@@ -37,6 +89,7 @@ class Generator:
     def __init__(self, directive_prefix, directive_translate, unknown_directive="warn"):
         self.dir_prefix = directive_prefix
         self.dir_translate = directive_translate
+        self._compiled = {}
         if unknown_directive not in ("fail", "warn", "ignore"):
             raise ConfigurationError(
                 f"Invalid unknown directive behaviour: {unknown_directive!r},"
@@ -55,7 +108,9 @@ class Generator:
         Returns
         -------
         list
-            Lines of the script header, with endings
+            Fragments of the script header, with line endings. The generated
+            directives and the native directives are each grouped into a
+            single fragment
         """
 
         header = []
@@ -66,29 +121,23 @@ class Generator:
                 shebang += b"\n"
             header.append(shebang)
 
-        if self.dir_prefix is not None:
+        if self.dir_prefix is not None and script_data.get("directives"):
+            chunks = []
             for name, arg in script_data["directives"].items():
-                fmt = self.dir_translate.get(name)
-                if fmt is None:
+                translate = self._get_translation(name)
+                if translate is None:
                     self._unknown_directive(name)
                     continue
-                directives = None
-                if isinstance(fmt, bytes):
-                    directives = [fmt % arg]
-                else:
-                    directives = fmt(arg)
-                    if directives is None:
-                        directives = []
-                    elif isinstance(directives, bytes):
-                        directives = [directives]
-                header.extend(
-                    self.dir_prefix + directive + b"\n" for directive in directives
-                )
+                for directive in translate(arg):
+                    chunks.append(self.dir_prefix)
+                    chunks.append(directive)
+                    chunks.append(b"\n")
+            if chunks:
+                header.append(b"".join(chunks))
 
         native = script_data.get("native")
-        if native is not None:
-            for _, directive in native.values():
-                header.append(directive)
+        if native:
+            header.append(b"".join(directive for _, directive in native.values()))
 
         extra = script_data.get("extra")
         if extra is not None:
@@ -97,6 +146,17 @@ class Generator:
 
         return header
 
+    def _get_translation(self, name):
+        """Get the compiled translation for a directive, or None if unknown"""
+        translate = self._compiled.get(name)
+        if translate is None:
+            fmt = self.dir_translate.get(name)
+            if fmt is None:
+                return None
+            translate = compile_translation(fmt)
+            self._compiled[name] = translate
+        return translate
+
     def _unknown_directive(self, name):
         if self.unknown == "fail":
             raise InvocationError(f"Unknown directive {name!r}")
@@ -18,7 +18,7 @@ def setup_hooks(config, site):
         Site name
     """
     site_config = config.get_site_config(site)
-    for spec in Hook.registered_hooks.values():
+    for spec in Hook.freeze():
         req = site_config.get(spec.name, [])
         spec.instantiate(req)
         if req:
@@ -23,6 +23,9 @@ class Hook:
 
     registered_hooks = {}
 
+    #: Snapshot of ``registered_hooks.values()``, see :py:meth:`freeze`
+    _frozen = None
+
     @classmethod
     def declare(cls, func, name=None):
         """Register a hook
@@ -39,20 +42,40 @@ class Hook:
         hook = cls(name)
         functools.update_wrapper(hook, func)
         cls.registered_hooks[name] = hook
+        Hook._frozen = None
         return hook
 
+    @classmethod
+    def freeze(cls):
+        """Snapshot the registered hooks
+
+        The snapshot is reused until a new hook is declared.
+
+        Returns
+        -------
+        tuple of `Hook`
+            Registered hooks, in declaration order
+        """
+        if Hook._frozen is None:
+            Hook._frozen = tuple(cls.registered_hooks.values())
+        return Hook._frozen
+
     def __init__(self, name):
         self.name = name
         self._hooks = {}
         self._impl = None
+        self._requested = None
 
     def __call__(self, *args, **kwargs):
         if self._impl is None:
             raise ValueError("Attempt to call a non-instantiated hook registry")
-        _logger.debug("Executing %s hooks", self.name)
+        debug = _logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            _logger.debug("Executing %s hooks", self.name)
         results = []
         for funcname, func in self._impl:
-            _logger.debug("Calling hook function %s", funcname)
+            if debug:
+                _logger.debug("Calling hook function %s", funcname)
             res = func(*args, **kwargs)
             results.append(res)
         return results
@@ -63,8 +86,12 @@ class Hook:
         Parameters
         ----------
         hooks: list of str
-            Requested hooks
+            Requested hooks. If the same hooks were already instantiated, this
+            does nothing
         """
+        hooks = tuple(hooks)
+        if self._impl is not None and hooks == self._requested:
+            return
         hookfuncs = []
         for hookname in hooks:
             try:
@@ -73,7 +100,8 @@ class Hook:
                 msg = f"Implementation {hookname!r} not found for {self.name} hook"
                 raise ConfigurationError(msg)
             hookfuncs.append((hookname, hookfunc))
-        self._impl = hookfuncs
+        self._impl = tuple(hookfuncs)
+        self._requested = hooks
 
 
 @Hook.declare
@@ -1,14 +1,34 @@
 """Common hooks"""
 
 import logging
-import pathlib
+import os
 
 _logger = logging.getLogger(__name__)
 
+#: Output directories already created, indexed by (connection, directory)
+_output_dirs = {}
+
 
 def ensure_output_dir(site, output, dryrun=False):
-    """Ensure the output directory exists and return its path"""
-    return site.create_output_dir(output, dryrun=dryrun)
+    """Ensure the output directory exists and return its path
+
+    Directories created successfully are remembered, so that several hooks
+    sharing the same output directory only create it once.
+    """
+    site.wait_connection_check()
+    key = (site._connection, os.path.dirname(os.fspath(output)))
+    out_dir = _output_dirs.get(key)
+    if out_dir is not None:
+        return out_dir
+    out_dir = site.create_output_dir(output, dryrun=dryrun)
+    if not dryrun:
+        _output_dirs[key] = out_dir
+    return out_dir
+
+
+def clear_output_dir_cache():
+    """Forget which output directories have been created"""
+    _output_dirs.clear()
 
 
 def remove_previous_output(site, script, output, dryrun=False):
@@ -24,6 +44,20 @@ def check_connection(action, site, args):
         return True
 
 
+def check_connection_async(action, site, args):
+    """Startup hook to check the connection in the background when submitting
+
+    The result is awaited by the first hook that needs the connection, or at
+    the latest just before submission, see
+    `troika.sites.base.Site.wait_connection_check`. In both
+    cases the script has already been generated. Other actions check the
+    connection immediately.
+    """
+    if action != "submit":
+        return check_connection(action, site, args)
+    site.start_connection_check(dryrun=args.dryrun)
+
+
 def create_output_dir(site, script, output, dryrun=False):
     """Pre-submit hook to create the output directory"""
     ensure_output_dir(site, output, dryrun=dryrun)
@@ -32,18 +66,20 @@ def create_output_dir(site, script, output, dryrun=False):
 def copy_orig_script(site, script, output, dryrun=False):
     """Pre-submit hook to copy the original script to the remote server"""
     out_dir = ensure_output_dir(site, output, dryrun=dryrun)
-    script = pathlib.PurePath(script)
-    orig_script = script.with_suffix(script.suffix + ".orig")
-    site._connection.sendfile(orig_script, out_dir / orig_script.name, dryrun=dryrun)
+    orig_script = os.fspath(script) + ".orig"
+    orig_name = os.path.basename(orig_script)
+    site._connection.sendfile(
+        orig_script, os.path.join(out_dir, orig_name), dryrun=dryrun
+    )
 
 
 def copy_submit_logfile(action, site, args, sts, logfile):
     """Exit hook to copy the log file to the remote server when submitting a job"""
     if action != "submit":
         return
-    logfile = pathlib.PurePath(logfile)
     out_dir = ensure_output_dir(site, args.output, dryrun=args.dryrun)
-    site._connection.sendfile(logfile, out_dir / logfile.name, dryrun=args.dryrun)
+    dst = os.path.join(out_dir, os.path.basename(logfile))
+    site._connection.sendfile(logfile, dst, dryrun=args.dryrun)
 
 
 def copy_kill_logfile(action, site, args, sts, logfile):
@@ -51,8 +87,8 @@ def copy_kill_logfile(action, site, args, sts, logfile):
     if action != "kill":
         return
     if args.output:
-        logfile = pathlib.PurePath(logfile)
         out_dir = ensure_output_dir(site, args.output, dryrun=args.dryrun)
-        site._connection.sendfile(logfile, out_dir / logfile.name, dryrun=args.dryrun)
+        dst = os.path.join(out_dir, os.path.basename(logfile))
+        site._connection.sendfile(logfile, dst, dryrun=args.dryrun)
     else:
         _logger.error("copy_kill_logfile hook requires output argument to be passed")
@@ -1,17 +1,53 @@
 """ecFlow hooks"""
 
 import logging
+import mmap
+import os
 import pathlib
 
 from .. import InvocationError, RunError
 from ..connection import PIPE
 from ..connections.local import LocalConnection
-from ..parser import DirectiveParser
-from ..utils import check_retcode
+from ..parser import DirectiveParser, load_directives
+from ..utils import append_suffix, check_retcode
 
 _logger = logging.getLogger(__name__)
 
 
+def _read_directives(site, script, output, dryrun=False):
+    """Get the directives of the original script
+
+    Use the directives saved at submission time if available, otherwise parse
+    the original script, copying it back from the output directory if needed.
+    """
+    orig_script = append_suffix(script, ".orig")
+
+    saved = append_suffix(orig_script, ".directives")
+    try:
+        return load_directives(saved)
+    except (OSError, ValueError):
+        pass
+
+    if not orig_script.exists():
+        orig_script_copy = pathlib.PurePath(output).parent / orig_script.name
+        if output is not None:
+            try:
+                site._connection.getfile(orig_script_copy, orig_script, dryrun=dryrun)
+                _logger.debug(
+                    "Original script copied back from output directory: %r",
+                    orig_script_copy,
+                )
+            except (IOError, RunError) as e:
+                raise RunError(f"Could not copy back original script {e!s}")
+
+    parser = DirectiveParser()
+    with open(orig_script, "rb") as sin:
+        if os.fstat(sin.fileno()).st_size > 0:
+            with mmap.mmap(sin.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                parser.feed_buffer(buf)
+    return parser.data
+
+
 def abort_on_ecflow(site, script, output, jid, cancel_status, dryrun=False):
     """Post-kill hook to issue an abort on behalf of a job that was killed
     or cancelled without the opportunity to inform ecFlow itself."""
@@ -29,23 +65,8 @@ def abort_on_ecflow(site, script, output, jid, cancel_status, dryrun=False):
         )
 
     script = pathlib.Path(script)
-    orig_script = script.with_suffix(script.suffix + ".orig")
+    directives = _read_directives(site, script, output, dryrun=dryrun)
 
-    if not orig_script.exists():
-        orig_script_copy = pathlib.PurePath(output).parent / orig_script.name
-        if output is not None:
-            try:
-                site._connection.getfile(orig_script_copy, orig_script, dryrun=dryrun)
-                _logger.debug(
-                    f"Original script copied back from output directory: {orig_script_copy!r}"
-                )
-            except (IOError, RunError) as e:
-                raise RunError(f"Could not copy back original script {e!s}")
-
-    parser = DirectiveParser()
-    with open(orig_script, "rb") as sin:
-        for line in sin:
-            parser.feed(line)
     env = {}
     for directive, var, required in [
         ("ecflow_name", "ECF_NAME", True),
@@ -54,31 +75,34 @@ def abort_on_ecflow(site, script, output, jid, cancel_status, dryrun=False):
         ("ecflow_port", "ECF_PORT", False),
     ]:
         try:
-            env[var] = parser.data[directive].decode("ascii")
+            env[var] = directives[directive].decode("ascii")
         except KeyError:
             if required:
                 _logger.error(
-                    f"abort_on_ecflow could not find {directive} defined in script {script}"
+                    "abort_on_ecflow could not find %s defined in script %s",
+                    directive,
+                    script,
                 )
                 raise
 
-    cmd = [parser.data.get("ecflow_client", "ecflow_client"), f"--abort={msg}"]
+    cmd = [directives.get("ecflow_client", "ecflow_client"), f"--abort={msg}"]
 
     if site._connection.is_local():
-        _logger.debug(
-            f'abort_on_ecflow running {" ".join(cmd)} on local site with env {env!r}'
-        )
+        where = "on local site"
         connection = site._connection
     elif "ecflow_host" in env:
-        _logger.debug(
-            f'abort_on_ecflow running {" ".join(cmd)} on remote site with env {env!r}'
-        )
+        where = "on remote site"
         connection = site._connection
     else:
+        where = "locally"
+        connection = LocalConnection({}, site._connection.user)
+    if _logger.isEnabledFor(logging.DEBUG):
         _logger.debug(
-            f'abort_on_ecflow running {" ".join(cmd)} locally with env {env!r}'
+            "abort_on_ecflow running %s %s with env %r",
+            " ".join(os.fsdecode(arg) for arg in cmd),
+            where,
+            env,
         )
-        connection = LocalConnection({}, site._connection.user)
 
     proc = connection.execute(cmd, stdout=PIPE, stderr=PIPE, env=env, dryrun=dryrun)
     if dryrun:
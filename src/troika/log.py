@@ -1,6 +1,7 @@
 """Logging system"""
 
 import logging
+import os
 import pathlib
 
 LOGLEVELS = [
@@ -39,8 +40,8 @@ def get_logfile_path(action, script=None):
     'troika.submitlog'
     """
 
-    base = pathlib.Path(script if script is not None else "troika")
-    return base.with_suffix(base.suffix + f".{action}log")
+    base = os.fspath(script) if script is not None else "troika"
+    return pathlib.Path(f"{base}.{action}log")
 
 
 def config(verbose=0, logfile=None, logmode="a"):
@@ -60,8 +61,11 @@ def config(verbose=0, logfile=None, logmode="a"):
     loglevel = LOGLEVELS[max(0, min(len(LOGLEVELS) - 1, default_log + verbose))]
 
     log_format = "%(asctime)s; %(name)s; %(levelname)s; %(message)s"
+    formatter = logging.Formatter(log_format)
 
-    logging.basicConfig(format=log_format, level=loglevel)
+    sh = logging.StreamHandler()
+    sh.setFormatter(formatter)
+    logging.basicConfig(level=loglevel, handlers=[sh])
 
     if logfile is not None:
         root_logger = logging.getLogger()
@@ -71,7 +75,7 @@ def config(verbose=0, logfile=None, logmode="a"):
             _logger.error("Cannot open log file: %s", e)
             return
 
-        fh.setFormatter(logging.Formatter(log_format))
+        fh.setFormatter(formatter)
         fh.setLevel(logging.DEBUG)
         root_logger.addHandler(fh)
         _logger.debug("Writing logs to %r", str(logfile))
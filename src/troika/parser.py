@@ -11,6 +11,7 @@ and underscores, and do not start with a number. Whitespace is removed around
 the equals sign and at the end the value.
 """
 
+import json
 import re
 from collections import OrderedDict
 
@@ -74,6 +75,15 @@ class DirectiveParser(BaseParser):
 
     DIRECTIVE_RE = re.compile(rb"^#\s*troika\s+(.+?)\s*$", re.I)
     KEYVAL_RE = re.compile(rb"^([A-Za-z_][A-Za-z0-9_]*)\s*=\s*(.*)$")
+    #: Combination of `DIRECTIVE_RE` and `KEYVAL_RE`, matching a valid directive
+    DIRECTIVE_KEYVAL_RE = re.compile(
+        rb"^#\s*troika\s+([A-Za-z_][A-Za-z0-9_]*)\s*=\s*(.*?)\s*$", re.I
+    )
+    #: Same as `DIRECTIVE_KEYVAL_RE`, for searching a whole buffer at once
+    DIRECTIVE_KEYVAL_MULTI_RE = re.compile(
+        rb"^#[^\S\n]*troika[^\S\n]+([A-Za-z_][A-Za-z0-9_]*)[^\S\n]*=[^\S\n]*(.*?)\s*$",
+        re.I | re.M,
+    )
 
     def __init__(self, aliases=None):
         super().__init__()
@@ -85,22 +95,40 @@ class DirectiveParser(BaseParser):
 
         See ``BaseParser.feed``
         """
-        dm = self.DIRECTIVE_RE.match(line)
-        if dm is None:
+        if not line.startswith(b"#"):
             return False
 
-        kv = dm.group(1)
-        kvm = self.KEYVAL_RE.match(kv)
-        if kvm is None:
-            raise ParseError(f"Invalid key-value pair: {kv}")
+        m = self.DIRECTIVE_KEYVAL_RE.match(line)
+        if m is None:
+            dm = self.DIRECTIVE_RE.match(line)
+            if dm is not None:
+                raise ParseError(f"Invalid key-value pair: {dm.group(1)}")
+            return False
 
-        key, value = kvm.groups()
+        key, value = m.groups()
         key = key.decode("ascii")
         key = self.aliases.get(key, key)
         self.data[key] = value
 
         return True
 
+    def feed_buffer(self, buf):
+        """Extract all the valid directives from a buffer
+
+        Unlike ``feed``, malformed directives are ignored rather than causing
+        an error.
+
+        Parameters
+        ----------
+        buf: bytes-like
+            Script contents, e.g. a memory-mapped file
+        """
+        for m in self.DIRECTIVE_KEYVAL_MULTI_RE.finditer(buf):
+            key, value = m.groups()
+            key = key.decode("ascii")
+            key = self.aliases.get(key, key)
+            self.data[key] = value
+
     def parse_directive_args(self, args):
         """Process a list of name=value arguments. Returns a dict."""
         data = {}
@@ -152,7 +180,8 @@ class MultiParser(BaseParser):
     """Composition of multiple parsers
 
     A line fed to this parser is fed to each subparser in order, until the
-    first True return value.
+    first True return value. Sub-parsers with a true ``done`` attribute are
+    not fed any further lines.
 
     Parameters
     ----------
@@ -163,18 +192,76 @@ class MultiParser(BaseParser):
     def __init__(self, parsers):
         super().__init__()
         self.parsers = parsers
+        self._feeds = [parser.feed for _, parser in parsers]
+        self._finite = [parser for _, parser in parsers if hasattr(parser, "done")]
 
     def feed(self, line):
         """Process the given line
 
         See ``BaseParser.feed``
         """
-        for _, parser in self.parsers:
-            drop = parser.feed(line)
-            if drop:
-                return True
-        return False
+        drop = False
+        for feed in self._feeds:
+            if feed(line):
+                drop = True
+                break
+        if self._finite:
+            for parser in [parser for parser in self._finite if parser.done]:
+                self._finite.remove(parser)
+                self._feeds.remove(parser.feed)
+        return drop
 
     @property
     def data(self):
         return {label: parser.data for label, parser in self.parsers}
+
+
+def save_directives(path, directives):
+    """Save parsed directives to a file
+
+    Only `bytes` values are saved. The file can be read back using
+    :py:func:`load_directives`, avoiding to parse the script again.
+
+    Parameters
+    ----------
+    path: path-like
+        Output file
+    directives: dict[str, bytes]
+        Directives, e.g. ``DirectiveParser.data``
+    """
+    data = {
+        key: value.decode("utf-8", "surrogateescape")
+        for key, value in directives.items()
+        if isinstance(value, bytes)
+    }
+    with open(path, "w") as sout:
+        json.dump(data, sout)
+
+
+def load_directives(path):
+    """Load directives saved using :py:func:`save_directives`
+
+    Parameters
+    ----------
+    path: path-like
+        Input file
+
+    Returns
+    -------
+    collections.OrderedDict[str, bytes]
+        Directives
+
+    Raises
+    ------
+    OSError
+        If the file cannot be read
+    ValueError
+        If the file contents are invalid
+    """
+    with open(path, "rb") as sin:
+        data = json.load(sin)
+    if not isinstance(data, dict):
+        raise ValueError(f"Invalid directives file: {path!s}")
+    return OrderedDict(
+        (key, value.encode("utf-8", "surrogateescape")) for key, value in data.items()
+    )
@@ -56,12 +56,10 @@ def list_sites(config):
         raise ConfigurationError("No 'sites' defined in configuration")
 
     for name, site in sites.items():
-        try:
-            tp = site["type"]
-        except KeyError:
+        tp = site.get("type")
+        if tp is None:
             raise ConfigurationError(f"Site {name!r} has no 'type'")
-        try:
-            conn = site["connection"]
-        except KeyError:
+        conn = site.get("connection")
+        if conn is None:
             raise ConfigurationError(f"Site {name!r} has no 'connection'")
         yield name, tp, conn
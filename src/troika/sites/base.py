@@ -1,10 +1,11 @@
 """Base site class"""
 
+import concurrent.futures
 import logging
 import os
 import pathlib
 
-from .. import ConfigurationError, generator
+from .. import ConfigurationError, RunError, generator
 from ..connection import PIPE
 from ..utils import check_retcode, command_as_list, normalise_signal
 
@@ -40,6 +41,13 @@ class Site:
     #: using the ``%`` operator
     directive_translate = {}
 
+    #: Cached result of :py:meth:`get_directive_translation`
+    _directive_translation = None
+
+    #: Pending background connection check, see
+    #: :py:meth:`start_connection_check`
+    _connection_check = None
+
     def __init__(self, config, connection, global_config):
         self.config = config
         self._connection = connection
@@ -50,6 +58,9 @@ class Site:
             ]
         except (TypeError, ValueError) as e:
             raise ConfigurationError(f"Invalid kill sequence: {e!s}")
+        self._pmkdir_command = command_as_list(
+            config.get("pmkdir_command", ["mkdir", "-p"])
+        )
 
     def submit(self, script, user, output, dryrun=False):
         """Submit a job
@@ -150,6 +161,43 @@ class Site:
         """
         return self._connection.checkstatus(timeout=timeout, dryrun=dryrun)
 
+    def start_connection_check(self, timeout=None, dryrun=False):
+        """Start checking the connection in the background
+
+        The result is awaited by :py:meth:`wait_connection_check`.
+
+        Parameters
+        ----------
+        timeout: int
+            If set, consider the connection is not working if no response after
+            this number of seconds
+        dryrun: bool
+            If True, do not do anything but print the command that would be
+            executed
+        """
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self._connection_check = executor.submit(
+            self.check_connection, timeout=timeout, dryrun=dryrun
+        )
+        executor.shutdown(wait=False)
+
+    def wait_connection_check(self):
+        """Wait for the check started by :py:meth:`start_connection_check`
+
+        Does nothing if no check is pending.
+
+        Raises
+        ------
+        `troika.RunError`
+            The connection is not working
+        """
+        check = self._connection_check
+        if check is None:
+            return
+        self._connection_check = None
+        if not check.result():
+            raise RunError("Connection not working")
+
     def create_output_dir(self, output, dryrun=False):
         """Create the output directory for a job to be submitted
 
@@ -167,9 +215,7 @@ class Site:
             Path to the newly created directory
         """
         out_dir = pathlib.PurePath(output).parent
-        pmkdir_command = command_as_list(
-            self.config.get("pmkdir_command", ["mkdir", "-p"])
-        )
+        pmkdir_command = self._pmkdir_command
         proc = self._connection.execute(
             pmkdir_command + [out_dir], stdout=PIPE, stderr=PIPE, dryrun=dryrun
         )
@@ -202,12 +248,17 @@ class Site:
     def get_directive_translation(self):
         """Construct the translation params
 
+        The result is computed on the first call and reused afterwards. The
+        returned table is shared and should not be modified.
+
         Returns
         -------
         tuple
             ``(directive_prefix, directive_translate)``, updated with the
             configuration overrides
         """
+        if self._directive_translation is not None:
+            return self._directive_translation
         prefix = self.config.get("directive_prefix", self.directive_prefix)
         translate = self.directive_translate.copy()
         for name, fmt in self.config.get("directive_translate", {}).items():
@@ -215,7 +266,8 @@ class Site:
                 translate[name] = generator.ignore
             else:
                 translate[name] = fmt.encode("utf-8")
-        return (prefix, translate)
+        self._directive_translation = (prefix, translate)
+        return self._directive_translation
 
     def remove_previous_output(self, output, dryrun=False):
         """Remove previous output file if existing.
@@ -229,8 +281,11 @@ class Site:
             executed
 
         """
-        if os.path.exists(output):
-            if dryrun:
+        if dryrun:
+            if os.path.exists(output):
                 _logger.info("removing:\n%s", output)
-            else:
-                os.remove(output)
+            return
+        try:
+            os.remove(output)
+        except FileNotFoundError:
+            pass
@@ -3,15 +3,44 @@
 import logging
 import os
 import pathlib
+import select
 import signal
 import time
 
 from .. import ConfigurationError, InvocationError, RunError
+from ..utils import append_suffix, open_output_file, read_jid
 from .base import Site
 
 _logger = logging.getLogger(__name__)
 
 
+def _pidfd_open(pid):
+    """Open a file descriptor referring to a process
+
+    Returns None if the process does not exist or pidfds are not supported
+    by the platform, in which case the caller should fall back to using the
+    PID directly.
+    """
+    try:
+        return os.pidfd_open(pid)
+    except (AttributeError, OSError):
+        return None
+
+
+def _wait_exit(pidfd, timeout):
+    """Wait for the process referred to by `pidfd` to exit
+
+    Returns True if the process exited within `timeout` seconds. If `pidfd`
+    is None, sleep for the full duration and return False.
+    """
+    if pidfd is None:
+        time.sleep(timeout)
+        return False
+    poller = select.poll()
+    poller.register(pidfd, select.POLLIN)
+    return bool(poller.poll(timeout * 1000))
+
+
 class DirectExecSite(Site):
     """Site where jobs are run directly"""
 
@@ -33,7 +62,9 @@ class DirectExecSite(Site):
 
     def submit(self, script, user, output, dryrun=False):
         """See `troika.sites.base.Site.submit`"""
-        script = pathlib.Path(script).resolve()
+        script = pathlib.Path(script)
+        if not script.is_absolute():
+            script = script.resolve()
         if not script.exists():
             raise InvocationError(f"Script file {str(script)!r} does not exist")
 
@@ -49,31 +80,28 @@ class DirectExecSite(Site):
         if self._copy_script or (self._connection.is_local() and not self._use_shell):
             args.append(script_remote)
 
-        inpf = None
-        if self._use_shell and not self._copy_script:
-            inpf = script.open(mode="rb")
-
         output = pathlib.Path(output)
         self.create_output_dir(output, dryrun=dryrun)
-        if output.exists():
-            _logger.warning("Output file %r already exists, overwriting", str(output))
-        outf = None
-        if not dryrun:
-            outf = output.open(mode="wb")
-        proc = self._connection.execute(
-            args, stdin=inpf, stdout=outf, detach=True, dryrun=dryrun
-        )
+        outf = open_output_file(output, dryrun=dryrun)
+
+        inpf = None
+        if self._use_shell and not self._copy_script:
+            inpf = os.open(script, os.O_RDONLY | os.O_CLOEXEC)
+        try:
+            proc = self._connection.execute(
+                args, stdin=inpf, stdout=outf, detach=True, dryrun=dryrun
+            )
+        finally:
+            # The child holds its own copy of the descriptor
+            if inpf is not None:
+                os.close(inpf)
 
         if dryrun:
             return
 
-        jid_output = script.with_suffix(script.suffix + ".jid")
-        if jid_output.exists():
-            _logger.warning(
-                "Job ID output file %r already exists, " + "overwriting",
-                str(jid_output),
-            )
-        jid_output.write_text(str(proc.pid) + "\n")
+        jid_output = append_suffix(script, ".jid")
+        with open_output_file(jid_output, "Job ID output file") as jidf:
+            jidf.write(f"{proc.pid}\n".encode())
 
         if self._copy_jid:
             jid_remote = pathlib.PurePath(output).parent / jid_output.name
@@ -96,14 +124,8 @@ class DirectExecSite(Site):
         except ValueError:
             raise RunError(f"Invalid job id: {jid!r}")
 
-        stat_output = script.with_suffix(script.suffix + ".stat")
-        if stat_output.exists():
-            _logger.warning(
-                "Status file %r already exists, overwriting", str(stat_output)
-            )
-        outf = None
-        if not dryrun:
-            outf = stat_output.open(mode="wb")
+        stat_output = append_suffix(script, ".stat")
+        outf = open_output_file(stat_output, "Status file", dryrun=dryrun)
 
         conn = self._connection.get_parent()
         conn.execute(["ps", "-lyfp", str(jid)], stdout=outf, dryrun=dryrun)
@@ -129,28 +151,39 @@ class DirectExecSite(Site):
             seq = [(0, signal.SIGTERM)]
 
         cancel_status = None
-        for wait, sig in seq:
-            time.sleep(wait)
-            if sig is None:
-                sig = signal.SIGTERM
-
-            if dryrun:
-                _logger.info(f"Sending {sig.name} to process {jid}")
-                continue
-
-            _logger.debug(f"Sending {sig.name} to process {jid}")
-            try:
-                os.kill(jid, sig.value)
-            except ProcessLookupError:
-                if cancel_status is None:
-                    raise RunError(f"Process ID {jid} not found")
-                else:
+        pidfd = None if dryrun else _pidfd_open(jid)
+        try:
+            for wait, sig in seq:
+                if _wait_exit(pidfd, wait):
+                    if cancel_status is None:
+                        raise RunError(f"Process ID {jid} not found")
                     break
+                if sig is None:
+                    sig = signal.SIGTERM
+
+                if dryrun:
+                    _logger.info("Sending %s to process %d", sig.name, jid)
+                    continue
 
-            if sig == signal.SIGKILL:
-                cancel_status = "KILLED"
-            else:
-                cancel_status = "TERMINATED"
+                _logger.debug("Sending %s to process %d", sig.name, jid)
+                try:
+                    if pidfd is None:
+                        os.kill(jid, sig.value)
+                    else:
+                        signal.pidfd_send_signal(pidfd, sig.value)
+                except ProcessLookupError:
+                    if cancel_status is None:
+                        raise RunError(f"Process ID {jid} not found")
+                    else:
+                        break
+
+                if sig == signal.SIGKILL:
+                    cancel_status = "KILLED"
+                else:
+                    cancel_status = "TERMINATED"
+        finally:
+            if pidfd is not None:
+                os.close(pidfd)
 
         return (jid, cancel_status)
 
@@ -166,9 +199,9 @@ class DirectExecSite(Site):
 
     def _parse_jidfile(self, script, output=None, dryrun=False):
         script = pathlib.Path(script)
-        jid_output = script.with_suffix(script.suffix + ".jid")
+        jid_output = append_suffix(script, ".jid")
         try:
-            return jid_output.read_text().strip()
+            return read_jid(jid_output)
         except IOError as e:
             if self._copy_jid and output is not None:
                 jid_remote = pathlib.PurePath(output).parent / jid_output.name
@@ -178,7 +211,7 @@ class DirectExecSite(Site):
                         "Job ID file copied back from output directory: %s", jid_remote
                     )
                     if not dryrun:
-                        return jid_output.read_text().strip()
+                        return read_jid(jid_output)
                 except (IOError, RunError) as e2:
                     raise RunError(
                         f"Could not read the job id: {e!s} or copy it back {e2!s}"
@@ -1,5 +1,6 @@
 """Site group class"""
 
+import concurrent.futures
 import logging
 
 from .. import RunError
@@ -19,21 +20,56 @@ class SiteGroup(Site):
         self._connection = self._selected._connection
 
     def _select(self, config, user, global_config):
-        """Find a suitable site"""
-        sites = config.get("sites", [])
+        """Find a suitable site
+
+        The sites are tried in order, and the first one that passes the check
+        is selected. If ``check_timeout`` is set, all the sites are checked
+        concurrently, each check being bounded by that timeout.
+        """
+        names = config.get("sites", [])
+        timeout = config.get("check_timeout", None)
         self._selected = None
-        for name in sites:
-            _logger.debug("Trying site %r", name)
-            site = get_site(global_config, name, user)
-            if self._check(site):
-                self._selected = site
-                break
+        if timeout is None:
+            for name in names:
+                site, ok = self._try_site(name, user, global_config)
+                if ok:
+                    self._selected = site
+                    break
+        elif names:
+            self._select_concurrent(names, user, global_config, timeout)
         if self._selected is None:
             raise RunError("No site available in the group")
 
-    def _check(self, site):
+    def _select_concurrent(self, names, user, global_config, timeout):
+        """Check the sites concurrently, with a bounded check time"""
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=len(names))
+        checks = [
+            executor.submit(self._try_site, name, user, global_config, timeout)
+            for name in names
+        ]
+        try:
+            # Errors for a site, e.g. configuration errors, are only raised if
+            # all the sites before it failed
+            for check in checks:
+                site, ok = check.result()
+                if ok:
+                    self._selected = site
+                    break
+        finally:
+            for check in checks:
+                check.cancel()
+            # Running checks are bounded by the timeout
+            executor.shutdown(wait=False)
+
+    def _try_site(self, name, user, global_config, timeout=None):
+        """Create a site and check whether it is suitable"""
+        _logger.debug("Trying site %r", name)
+        site = get_site(global_config, name, user)
+        return site, self._check(site, timeout=timeout)
+
+    def _check(self, site, timeout=None):
         """Check whether a given site is suitable"""
-        return site.check_connection()
+        return site.check_connection(timeout=timeout)
 
     def preprocess(self, script, user, output):
         """See `troika.sites.base.Site.preprocess`"""
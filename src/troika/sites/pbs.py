@@ -6,16 +6,25 @@ import pathlib
 import re
 import signal
 import time
-from collections import OrderedDict
 
 from .. import InvocationError, RunError
 from ..connection import PIPE
 from ..parser import BaseParser
-from ..utils import check_retcode, command_as_list
+from ..utils import (
+    append_suffix,
+    check_retcode,
+    command_as_list,
+    open_output_file,
+    read_jid,
+)
 from .base import Site
 
 _logger = logging.getLogger(__name__)
 
+#: Encoding used to decode the output of qsub. Computed once, as
+#: ``locale.getpreferredencoding()`` may probe the locale settings on each call
+_PREFERRED_ENCODING = locale.getpreferredencoding(False)
+
 
 def _split_pbs_directive(arg):
     """Split the argument of a PBS directive
@@ -26,15 +35,15 @@ def _split_pbs_directive(arg):
     (b'-N', b'job')
     >>> _split_pbs_directive(b"-V")
     (b'-V', None)
+    >>> _split_pbs_directive(b"-l  select=1:ncpus=4 ")
+    (b'-l', b'select=1:ncpus=4 ')
     """
-    m = re.match(rb"(\S+)(\s+)?(.*)?$", arg)
-    if m is None:
-        raise RunError(r"Malformed qsub argument: {arg!r}")
-    key, sep, val = m.groups()
-    if sep is None:
-        assert val == b""
-        val = None
-    return key, val
+    parts = arg.split(None, 1)
+    if not parts:
+        raise RunError(f"Malformed qsub argument: {arg!r}")
+    if len(parts) == 1:
+        return parts[0], None
+    return parts[0], parts[1]
 
 
 class PBSDirectiveParser(BaseParser):
@@ -47,7 +56,7 @@ class PBSDirectiveParser(BaseParser):
 
     Members
     -------
-    data: collections.OrderedDict[bytes, (bytes or None, bytes)]
+    data: dict[bytes, (bytes or None, bytes)]
         Directives that have been parsed. The first item of the dict value is
         the parsed value, if any, and the second is the full line, including
         the line terminator.
@@ -57,7 +66,7 @@ class PBSDirectiveParser(BaseParser):
 
     def __init__(self, drop_keys=None):
         super().__init__()
-        self.data = OrderedDict()
+        self.data = {}
         if drop_keys is None:
             drop_keys = []
         self.drop_keys = set(drop_keys)
@@ -67,6 +76,8 @@ class PBSDirectiveParser(BaseParser):
 
         See ``BaseParser.feed``
         """
+        if not line.startswith(b"#"):
+            return False
         m = self.DIRECTIVE_RE.match(line)
         if m is None:
             return False
@@ -86,12 +97,14 @@ def _translate_export_vars(value):
     return b"-v %s" % value
 
 
+_MAIL_TYPES = {b"none": b"n", b"begin": b"b", b"end": b"e", b"fail": b"a"}
+
+
 def _translate_mail_type(value):
-    trans = {b"none": b"n", b"begin": b"b", b"end": b"e", b"fail": b"a"}
     vals = value.split(b",")
     newvals = []
     for val in vals:
-        newval = trans.get(val.lower())
+        newval = _MAIL_TYPES.get(val.lower())
         if newval is None:
             _logger.warn("Unknown mail_type value %r", val)
             newval = val
@@ -169,16 +182,12 @@ class PBSSite(Site):
                     "qsub stderr for script %s:\n%s", script, proc_stderr.strip()
                 )
 
-        jobid = proc_stdout.decode(locale.getpreferredencoding()).strip()
+        jobid = proc_stdout.decode(_PREFERRED_ENCODING).strip()
         _logger.debug("PBS job ID: %s", jobid)
 
-        jid_output = script.with_suffix(script.suffix + ".jid")
-        if jid_output.exists():
-            _logger.warning(
-                "Job ID output file %r already exists, " + "overwriting",
-                str(jid_output),
-            )
-        jid_output.write_text(str(jobid) + "\n")
+        jid_output = append_suffix(script, ".jid")
+        with open_output_file(jid_output, "Job ID output file") as jidf:
+            jidf.write(f"{jobid}\n".encode())
 
         if self._copy_jid:
             jid_remote = pathlib.PurePath(output).parent / jid_output.name
@@ -197,14 +206,8 @@ class PBSSite(Site):
         else:
             _logger.debug(f"Using specified job id {jid!r}")
 
-        stat_output = script.with_suffix(script.suffix + ".stat")
-        if stat_output.exists():
-            _logger.warning(
-                "Status file %r already exists, overwriting", str(stat_output)
-            )
-        outf = None
-        if not dryrun:
-            outf = stat_output.open(mode="wb")
+        stat_output = append_suffix(script, ".stat")
+        outf = open_output_file(stat_output, "Status file", dryrun=dryrun)
 
         self._connection.execute(self._qstat + [jid], stdout=outf, dryrun=dryrun)
 
@@ -259,9 +262,9 @@ class PBSSite(Site):
 
     def _parse_jidfile(self, script, output=None, dryrun=False):
         script = pathlib.Path(script)
-        jid_output = script.with_suffix(script.suffix + ".jid")
+        jid_output = append_suffix(script, ".jid")
         try:
-            return jid_output.read_text().strip()
+            return read_jid(jid_output)
         except IOError as e:
             if self._copy_jid and output is not None:
                 jid_remote = pathlib.PurePath(output).parent / jid_output.name
@@ -271,7 +274,7 @@ class PBSSite(Site):
                         "Job ID file copied back from output directory: %s", jid_remote
                     )
                     if not dryrun:
-                        return jid_output.read_text().strip()
+                        return read_jid(jid_output)
                 except (IOError, RunError) as e2:
                     raise RunError(
                         f"Could not read the job id: {e!s} or copy it back {e2!s}"
@@ -1,15 +1,19 @@
 """SGE-managed site"""
 
-import locale
 import logging
 import pathlib
 import re
-from collections import OrderedDict
 
 from .. import InvocationError, RunError
 from ..connection import PIPE
 from ..parser import BaseParser
-from ..utils import check_retcode, command_as_list
+from ..utils import (
+    append_suffix,
+    check_retcode,
+    command_as_list,
+    open_output_file,
+    read_jid,
+)
 from .base import Site
 
 _logger = logging.getLogger(__name__)
@@ -24,15 +28,15 @@ def _split_sge_directive(arg):
     (b'-N', b'job')
     >>> _split_sge_directive(b"-V")
     (b'-V', None)
+    >>> _split_sge_directive(b"-l  h_rt=1:00:00")
+    (b'-l', b'h_rt=1:00:00')
     """
-    m = re.match(rb"(\S+)(\s+)?(.*)?$", arg)
-    if m is None:
-        raise RunError(r"Malformed qsub argument: {arg!r}")
-    key, sep, val = m.groups()
-    if sep is None:
-        assert val == b""
-        val = None
-    return key, val
+    parts = arg.split(None, 1)
+    if not parts:
+        raise RunError(f"Malformed qsub argument: {arg!r}")
+    if len(parts) == 1:
+        return parts[0], None
+    return parts[0], parts[1]
 
 
 class SGEDirectiveParser(BaseParser):
@@ -45,7 +49,7 @@ class SGEDirectiveParser(BaseParser):
 
     Members
     -------
-    data: collections.OrderedDict[bytes, (bytes or None, bytes)]
+    data: dict[bytes, (bytes or None, bytes)]
         Directives that have been parsed. The first item of the dict value is
         the parsed value, if any, and the second is the full line, including
         the line terminator.
@@ -55,7 +59,7 @@ class SGEDirectiveParser(BaseParser):
 
     def __init__(self, drop_keys=None):
         super().__init__()
-        self.data = OrderedDict()
+        self.data = {}
         if drop_keys is None:
             drop_keys = []
         self.drop_keys = set(drop_keys)
@@ -65,6 +69,8 @@ class SGEDirectiveParser(BaseParser):
 
         See ``BaseParser.feed``
         """
+        if not line.startswith(b"#"):
+            return False
         m = self.DIRECTIVE_RE.match(line)
         if m is None:
             return False
@@ -84,12 +90,14 @@ def _translate_export_vars(value):
     return b"-v %s" % value
 
 
+_MAIL_TYPES = {b"none": b"n", b"begin": b"b", b"end": b"e", b"fail": b"a"}
+
+
 def _translate_mail_type(value):
-    trans = {b"none": b"n", b"begin": b"b", b"end": b"e", b"fail": b"a"}
     vals = value.split(b",")
     newvals = []
     for val in vals:
-        newval = trans.get(val.lower())
+        newval = _MAIL_TYPES.get(val.lower())
         if newval is None:
             _logger.warn("Unknown mail_type value %r", val)
             newval = val
@@ -115,7 +123,9 @@ class SGESite(Site):
         "walltime": b"-l h_rt=%s",
     }
 
-    SUBMIT_RE = re.compile(r"(Your job )?(\d+)")
+    #: Job ID in the qsub output, e.g. ``Your job 1234 ("name") has been
+    #: submitted``
+    SUBMIT_RE = re.compile(rb"\d+")
 
     def __init__(self, config, connection, global_config):
         super().__init__(config, connection, global_config)
@@ -130,7 +140,7 @@ class SGESite(Site):
         if match is None:
             _logger.warn("Could not parse SGE output %r", out)
             return None
-        return int(match.group(2))
+        return int(match.group(0))
 
     def submit(self, script, user, output, dryrun=False):
         """See `troika.sites.Site.submit`"""
@@ -175,18 +185,12 @@ class SGESite(Site):
                     "qsub stderr for script %s:\n%s", script, proc_stderr.strip()
                 )
 
-        jobid = self._parse_submit_output(
-            proc_stdout.decode(locale.getpreferredencoding()).strip()
-        )
+        jobid = self._parse_submit_output(proc_stdout)
         _logger.debug("SGE job ID: %s", jobid)
 
-        jid_output = script.with_suffix(script.suffix + ".jid")
-        if jid_output.exists():
-            _logger.warning(
-                "Job ID output file %r already exists, " + "overwriting",
-                str(jid_output),
-            )
-        jid_output.write_text(str(jobid) + "\n")
+        jid_output = append_suffix(script, ".jid")
+        with open_output_file(jid_output, "Job ID output file") as jidf:
+            jidf.write(f"{jobid}\n".encode())
 
         if self._copy_jid:
             jid_remote = pathlib.PurePath(output).parent / jid_output.name
@@ -205,14 +209,8 @@ class SGESite(Site):
         else:
             _logger.debug(f"Using specified job id {jid!r}")
 
-        stat_output = script.with_suffix(script.suffix + ".stat")
-        if stat_output.exists():
-            _logger.warning(
-                "Status file %r already exists, overwriting", str(stat_output)
-            )
-        outf = None
-        if not dryrun:
-            outf = stat_output.open(mode="wb")
+        stat_output = append_suffix(script, ".stat")
+        outf = open_output_file(stat_output, "Status file", dryrun=dryrun)
 
         self._connection.execute(self._qstat + ["-j", jid], stdout=outf, dryrun=dryrun)
 
@@ -248,9 +246,9 @@ class SGESite(Site):
 
     def _parse_jidfile(self, script, output=None, dryrun=False):
         script = pathlib.Path(script)
-        jid_output = script.with_suffix(script.suffix + ".jid")
+        jid_output = append_suffix(script, ".jid")
         try:
-            return jid_output.read_text().strip()
+            return read_jid(jid_output)
         except IOError as e:
             if self._copy_jid and output is not None:
                 jid_remote = pathlib.PurePath(output).parent / jid_output.name
@@ -260,7 +258,7 @@ class SGESite(Site):
                         "Job ID file copied back from output directory: %s", jid_remote
                     )
                     if not dryrun:
-                        return jid_output.read_text().strip()
+                        return read_jid(jid_output)
                 except (IOError, RunError) as e2:
                     raise RunError(
                         f"Could not read the job id: {e!s} or copy it back {e2!s}"
@@ -5,12 +5,18 @@ import pathlib
 import re
 import signal
 import time
-from collections import OrderedDict
 
 from .. import InvocationError, RunError, generator
 from ..connection import PIPE
 from ..parser import BaseParser, ParseError
-from ..utils import check_retcode, command_as_list, parse_bool
+from ..utils import (
+    append_suffix,
+    check_retcode,
+    command_as_list,
+    open_output_file,
+    parse_bool,
+    read_jid,
+)
 from .base import Site
 
 _logger = logging.getLogger(__name__)
@@ -25,15 +31,24 @@ def _split_slurm_directive(arg):
     (b'-J', b'job')
     >>> _split_slurm_directive(b"--exclusive")
     (b'--exclusive', None)
+    >>> _split_slurm_directive(b"--comment=two words")
+    (b'--comment', b'two words')
+    >>> _split_slurm_directive(b"=foo")
+    Traceback (most recent call last):
+    ...
+    troika.parser.ParseError: Malformed sbatch argument: b'=foo'
     """
-    m = re.match(rb"([^\s=]+)(=|\s+)?(.*)?$", arg)
-    if m is None:
-        raise ParseError(r"Malformed sbatch argument: {arg!r}")
-    key, sep, val = m.groups()
-    if sep is None:
-        assert val == b""
-        val = None
-    return key, val
+    parts = arg.split(None, 1)
+    if not parts or arg[:1].isspace():
+        raise ParseError(f"Malformed sbatch argument: {arg!r}")
+    key, eq, _ = parts[0].partition(b"=")
+    if not key:
+        raise ParseError(f"Malformed sbatch argument: {arg!r}")
+    if eq:
+        return key, arg.partition(b"=")[2]
+    if len(parts) == 1:
+        return key, None
+    return key, parts[1]
 
 
 class SlurmDirectiveParser(BaseParser):
@@ -46,7 +61,7 @@ class SlurmDirectiveParser(BaseParser):
 
     Members
     -------
-    data: collections.OrderedDict[bytes, (bytes or None, bytes)]
+    data: dict[bytes, (bytes or None, bytes)]
         Directives that have been parsed. The first item of the dict value is
         the parsed value, if any, and the second is the full line, including
         the line terminator.
@@ -54,18 +69,24 @@ class SlurmDirectiveParser(BaseParser):
 
     DIRECTIVE_RE = re.compile(rb"^#\s*SBATCH\s+(.+)$")
 
+    #: Output and error file directives, replaced by the generated ones
+    OUTPUT_KEYS = frozenset([b"-o", b"--output", b"-e", b"--error"])
+
     def __init__(self, drop_keys=None):
         super().__init__()
-        self.data = OrderedDict()
+        self.data = {}
         if drop_keys is None:
-            drop_keys = []
-        self.drop_keys = set(drop_keys)
+            drop_keys = ()
+        # No copy is made if drop_keys is already a frozenset
+        self.drop_keys = frozenset(drop_keys)
 
     def feed(self, line):
         """Process the given line
 
         See ``BaseParser.feed``
         """
+        if not line.startswith(b"#"):
+            return False
         m = self.DIRECTIVE_RE.match(line)
         if m is None:
             return False
@@ -105,12 +126,14 @@ def _translate_hyperthreading(value):
     return b"--hint=%smultithread" % flag
 
 
+_MAIL_TYPES = {b"none": b"NONE", b"begin": b"BEGIN", b"end": b"END", b"fail": b"FAIL"}
+
+
 def _translate_mail_type(value):
-    trans = {b"none": b"NONE", b"begin": b"BEGIN", b"end": b"END", b"fail": b"FAIL"}
     vals = value.split(b",")
     newvals = []
     for val in vals:
-        newval = trans.get(val.lower())
+        newval = _MAIL_TYPES.get(val.lower())
         if newval is None:
             _logger.warn("Unknown mail_type value %r", val)
             newval = val
@@ -154,7 +177,8 @@ class SlurmSite(Site):
         "working_dir": b"--chdir=%s",
     }
 
-    SUBMIT_RE = re.compile(rb"^(?:Submitted batch job )?(\d+)$", re.MULTILINE)
+    #: Prefix of the job ID line in the sbatch output
+    SUBMIT_PREFIX = b"Submitted batch job "
 
     def __init__(self, config, connection, global_config):
         super().__init__(config, connection, global_config)
@@ -165,11 +189,19 @@ class SlurmSite(Site):
         self._copy_jid = config.get("copy_jid", False)
 
     def _parse_submit_output(self, out):
-        match = self.SUBMIT_RE.search(out)
-        if match is None:
-            _logger.warn("Could not parse SLURM output %r", out)
-            return None
-        return int(match.group(1))
+        """Extract the job ID from the output of sbatch
+
+        The job ID is taken from the first line that is either
+        ``Submitted batch job <jid>`` or just ``<jid>`` (``--parsable``)
+        """
+        prefix_len = len(self.SUBMIT_PREFIX)
+        for line in out.split(b"\n"):
+            if line.startswith(self.SUBMIT_PREFIX):
+                line = line[prefix_len:]
+            if line.isdigit():
+                return int(line)
+        _logger.warn("Could not parse SLURM output %r", out)
+        return None
 
     def _get_state(self, jid, strict=True, dryrun=False):
         """Return the state of a SLURM job.
@@ -267,13 +299,9 @@ class SlurmSite(Site):
         jobid = self._parse_submit_output(proc_stdout)
         _logger.debug("Slurm job ID: %d", jobid)
 
-        jid_output = script.with_suffix(script.suffix + ".jid")
-        if jid_output.exists():
-            _logger.warning(
-                "Job ID output file %r already exists, " + "overwriting",
-                str(jid_output),
-            )
-        jid_output.write_text(str(jobid) + "\n")
+        jid_output = append_suffix(script, ".jid")
+        with open_output_file(jid_output, "Job ID output file") as jidf:
+            jidf.write(f"{jobid}\n".encode())
 
         if self._copy_jid:
             jid_remote = pathlib.PurePath(output).parent / jid_output.name
@@ -299,14 +327,8 @@ class SlurmSite(Site):
         except ValueError:
             raise RunError(f"Invalid job id: {jid!r}")
 
-        stat_output = script.with_suffix(script.suffix + ".stat")
-        if stat_output.exists():
-            _logger.warning(
-                "Status file %r already exists, overwriting", str(stat_output)
-            )
-        outf = None
-        if not dryrun:
-            outf = stat_output.open(mode="wb")
+        stat_output = append_suffix(script, ".stat")
+        outf = open_output_file(stat_output, "Status file", dryrun=dryrun)
 
         self._connection.execute(
             self._squeue + ["-u", user, "-j", str(jid)], stdout=outf, dryrun=dryrun
@@ -408,13 +430,13 @@ class SlurmSite(Site):
 
     def get_native_parser(self):
         """See `troika.sites.Site.get_native_parser`"""
-        return SlurmDirectiveParser(drop_keys=[b"-o", b"--output", b"-e", b"--error"])
+        return SlurmDirectiveParser(drop_keys=SlurmDirectiveParser.OUTPUT_KEYS)
 
     def _parse_jidfile(self, script, output=None, dryrun=False):
         script = pathlib.Path(script)
-        jid_output = script.with_suffix(script.suffix + ".jid")
+        jid_output = append_suffix(script, ".jid")
         try:
-            return jid_output.read_text().strip()
+            return read_jid(jid_output)
         except IOError as e:
             if self._copy_jid and output is not None:
                 jid_remote = pathlib.PurePath(output).parent / jid_output.name
@@ -424,7 +446,7 @@ class SlurmSite(Site):
                         "Job ID file copied back from output directory: %s", jid_remote
                     )
                     if not dryrun:
-                        return jid_output.read_text().strip()
+                        return read_jid(jid_output)
                 except (IOError, RunError) as e2:
                     raise RunError(
                         f"Could not read the job id: {e!s} or copy it back {e2!s}"
@@ -24,9 +24,12 @@ class Translator(Hook):
     def __call__(self, data, *args, **kwargs):
         if self._impl is None:
             raise ValueError("Attempt to call a non-instantiated hook registry")
-        _logger.debug("Translating directives")
+        debug = _logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            _logger.debug("Translating directives")
         for funcname, func in self._impl:
-            _logger.debug("Calling translator function %s", funcname)
+            if debug:
+                _logger.debug("Calling translator function %s", funcname)
             data = func(data, *args, **kwargs)
         return data
 
@@ -1,6 +1,9 @@
 """Various utilities"""
 
+import functools
 import logging
+import os
+import pathlib
 import signal
 
 from . import RunError
@@ -8,9 +11,12 @@ from . import RunError
 _logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=64, typed=True)
 def normalise_signal(sig):
     """Get the `signal.Signals` value associated with the given signal
 
+    Results are cached, the argument must be hashable.
+
     >>> normalise_signal(2)
     <Signals.SIGINT: 2>
     >>> normalise_signal('KILL')
@@ -184,3 +190,69 @@ def command_as_list(x):
     if isinstance(x, (str, bytes)):
         return [x]
     return list(x)
+
+
+def append_suffix(path, suffix):
+    """Return the given path with `suffix` appended to the file name
+
+    Equivalent to ``path.with_suffix(path.suffix + suffix)``, without parsing
+    the suffix
+
+    >>> str(append_suffix("foo/bar.sh", ".jid"))
+    'foo/bar.sh.jid'
+    >>> str(append_suffix(pathlib.PurePath("spam"), ".orig"))
+    'spam.orig'
+    """
+    return pathlib.Path(os.fspath(path) + suffix)
+
+
+def read_jid(path):
+    """Read a job ID from a file
+
+    The file is read as raw bytes, without going through a text wrapper.
+
+    Parameters
+    ----------
+    path: path-like
+        Path to the file
+
+    Returns
+    -------
+    str
+        Job ID, stripped of any surrounding whitespace
+    """
+    with open(path, "rb", buffering=0) as f:
+        return f.readall().strip().decode()
+
+
+def open_output_file(path, what="Output file", dryrun=False):
+    """Open a file for writing, warning if it already exists
+
+    The file is truncated if it exists. The existence check is done by the
+    ``open`` call itself, so that no extra ``stat`` is needed when the file
+    does not exist.
+
+    Parameters
+    ----------
+    path: path-like
+        Path to the file
+    what: str
+        Description of the file, used in the warning message
+    dryrun: bool
+        If True, only check for an existing file
+
+    Returns
+    -------
+    file-like or None
+        Unbuffered binary file object, or None if `dryrun` is True
+    """
+    if dryrun:
+        if os.path.exists(path):
+            _logger.warning("%s %r already exists, overwriting", what, str(path))
+        return None
+    try:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    except FileExistsError:
+        _logger.warning("%s %r already exists, overwriting", what, str(path))
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    return os.fdopen(fd, "wb", buffering=0)
@@ -1,4 +1,7 @@
+import os
 import signal
+import subprocess
+import time
 
 import pytest
 
@@ -73,3 +76,42 @@ def test_submit(dummy_direct_site, sample_script, tmp_path):
     assert retcode == 0
     assert output.exists()
     assert output.read_text().strip() == "Script called!"
+
+
+@pytest.mark.skipif(not hasattr(os, "pidfd_open"), reason="pidfd not supported")
+def test_kill_stops_waiting_on_exit(dummy_direct_conf, tmp_path):
+    cfg = dummy_direct_conf.copy()
+    cfg["kill_sequence"] = [(0, "TERM"), (30, "KILL")]
+    conn = LocalConnection(cfg, "user")
+    site = direct.DirectExecSite(cfg, conn, Config({}))
+    proc = subprocess.Popen(["sleep", "60"])
+    try:
+        start = time.monotonic()
+        jid, status = site.kill(tmp_path / "script.sh", "user", jid=proc.pid)
+        assert time.monotonic() - start < 30
+    finally:
+        proc.kill()
+        proc.wait()
+    assert jid == proc.pid
+    assert status == "TERMINATED"
+    assert proc.returncode == -signal.SIGTERM
+
+
+def test_kill_without_pidfd(monkeypatch, dummy_direct_conf, tmp_path):
+    sleeps = []
+    monkeypatch.setattr(direct, "_pidfd_open", lambda pid: None)
+    monkeypatch.setattr(direct.time, "sleep", sleeps.append)
+    cfg = dummy_direct_conf.copy()
+    cfg["kill_sequence"] = [(0, "TERM"), (30, "KILL")]
+    conn = LocalConnection(cfg, "user")
+    site = direct.DirectExecSite(cfg, conn, Config({}))
+    proc = subprocess.Popen(["sleep", "60"])
+    try:
+        jid, status = site.kill(tmp_path / "script.sh", "user", jid=proc.pid)
+    finally:
+        proc.kill()
+        proc.wait()
+    # Without a pidfd, the exit cannot be detected and the full wait is spent
+    assert sleeps == [0, 30]
+    assert jid == proc.pid
+    assert status == "KILLED"
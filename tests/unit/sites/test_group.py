@@ -0,0 +1,90 @@
+import time
+
+import pytest
+
+import troika
+from troika.config import Config
+from troika.sites import group
+
+
+class DummySite:
+    def __init__(self, name, ok, delay=0):
+        self._connection = name
+        self.ok = ok
+        self.delay = delay
+        self.timeout = None
+
+    def check_connection(self, timeout=None, dryrun=False):
+        self.timeout = timeout
+        time.sleep(self.delay)
+        return self.ok
+
+
+class DummyConnection:
+    user = "user"
+
+
+@pytest.fixture
+def make_group(monkeypatch):
+    def make(sites, **conf):
+        created = []
+
+        def get_site(global_config, name, user):
+            created.append(name)
+            site = sites[name]
+            if isinstance(site, Exception):
+                raise site
+            return site
+
+        monkeypatch.setattr(group, "get_site", get_site)
+        conf.update({"type": "group", "sites": list(sites)})
+        site = group.SiteGroup(conf, DummyConnection(), Config({}))
+        return site, created
+
+    return make
+
+
+def test_select_first_available(make_group):
+    sites = {
+        "down": DummySite("down", False),
+        "up": DummySite("up", True),
+        "broken": troika.ConfigurationError("broken"),
+    }
+    site, created = make_group(sites)
+    assert site._selected is sites["up"]
+    assert site._connection == "up"
+    assert created == ["down", "up"]
+
+
+def test_select_concurrent(make_group):
+    sites = {
+        "down": DummySite("down", False),
+        "slow": DummySite("slow", True, delay=0.2),
+        "fast": DummySite("fast", True),
+        "broken": troika.ConfigurationError("broken"),
+    }
+    site, _ = make_group(sites, check_timeout=5)
+    assert site._selected is sites["slow"]
+    assert sites["slow"].timeout == 5
+
+
+def test_select_concurrent_error(make_group):
+    sites = {
+        "down": DummySite("down", False),
+        "broken": troika.ConfigurationError("broken"),
+        "up": DummySite("up", True),
+    }
+    with pytest.raises(troika.ConfigurationError, match="broken"):
+        make_group(sites, check_timeout=5)
+
+
+@pytest.mark.parametrize("timeout", [None, 5])
+def test_select_none_available(make_group, timeout):
+    sites = {"a": DummySite("a", False), "b": DummySite("b", False)}
+    with pytest.raises(troika.RunError, match="No site available"):
+        make_group(sites, check_timeout=timeout)
+
+
+def test_select_empty(make_group):
+    with pytest.raises(troika.RunError, match="No site available"):
+        make_group({})
@@ -289,3 +289,57 @@ def test_output_path_type(path_type, dummy_controller, sample_script, tmp_path):
     dummy_controller.parse_script(sample_script)
     pp_script = dummy_controller.generate_script(sample_script, "user", output)
     assert pp_script == sample_script
+
+
+@pytest.mark.parametrize(
+    "out, jid",
+    [
+        pytest.param(b"Submitted batch job 1234\n", 1234, id="standard"),
+        pytest.param(b"5678\n", 5678, id="parsable"),
+        pytest.param(b"warning: foo\nSubmitted batch job 42\n", 42, id="warning"),
+        pytest.param(b"Submitted batch job 12a\n", None, id="invalid"),
+        pytest.param(b"", None, id="empty"),
+    ],
+)
+def test_parse_submit_output(out, jid, dummy_slurm_site):
+    assert dummy_slurm_site._parse_submit_output(out) == jid
+
+
+def test_generate_failure_keeps_script(
+    monkeypatch, dummy_controller, sample_script, tmp_path
+):
+    def copymode(src, dst):
+        raise OSError("copymode failed")
+
+    orig = sample_script.read_bytes()
+    monkeypatch.setattr(troika.controllers.base.shutil, "copymode", copymode)
+    output = tmp_path / "output.log"
+    dummy_controller.parse_script(sample_script)
+    with pytest.raises(OSError):
+        dummy_controller.generate_script(sample_script, "user", output)
+    assert sample_script.read_bytes() == orig
+    assert [p.name for p in tmp_path.iterdir()] == [sample_script.name]
+
+
+@pytest.mark.parametrize("cache", [False, True])
+def test_generate_cache_directives(dummy_controller, sample_script, tmp_path, cache):
+    saved = tmp_path / (sample_script.name + ".orig.directives")
+    output = tmp_path / "output.log"
+    dummy_controller.cache_directives = cache
+    dummy_controller.parse_script(sample_script)
+    dummy_controller.generate_script(sample_script, "user", output)
+    assert saved.exists() == cache
+
+
+def test_generate_cache_directives_failure(
+    dummy_controller, sample_script, tmp_path, caplog
+):
+    saved = tmp_path / (sample_script.name + ".orig.directives")
+    saved.mkdir()
+    output = tmp_path / "output.log"
+    dummy_controller.cache_directives = True
+    dummy_controller.parse_script(sample_script)
+    pp_script = dummy_controller.generate_script(sample_script, "user", output)
+    assert pp_script == sample_script
+    assert (tmp_path / (sample_script.name + ".orig")).exists()
+    assert "Could not save directives" in caplog.text
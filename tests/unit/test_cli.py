@@ -133,6 +133,33 @@ def test_submit(dummy_controller, dummy_site):
     assert dummy_site.submit_called
 
 
+@pytest.mark.parametrize("result", [False, OSError("boom")])
+def test_submit_connection_check_failed(
+    monkeypatch, dummy_controller, dummy_site, result
+):
+    def check_connection(timeout=None, dryrun=False):
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    monkeypatch.setattr(dummy_site, "check_connection", check_connection)
+    dummy_site.start_connection_check()
+    args = make_test_args(
+        action="submit",
+        site="dummy",
+        script="script",
+        user="user",
+        output="output",
+        dryrun=True,
+    )
+    cfg = Config({})
+    ctl = dummy_controller(cfg, args, None)
+    act = troika.cli.SubmitAction(args)
+    sts = act.run(cfg, ctl)
+    assert sts == 1
+    assert not dummy_site.submit_called
+
+
 def test_monitor(dummy_controller, dummy_site):
     args = make_test_args(
         action="monitor",
@@ -0,0 +1,19 @@
+import pytest
+
+from troika import components
+from troika.sites.direct import DirectExecSite
+
+
+def test_get_entrypoint():
+    components.clear_cache()
+    cls = components.get_entrypoint("troika.sites", "direct")
+    assert cls is DirectExecSite
+    assert components.get_entrypoint("troika.sites", "direct") is cls
+    assert components.get_group.cache_info().currsize == 1
+
+
+def test_get_entrypoint_unknown():
+    with pytest.raises(ValueError, match="Component 'unknown' not found"):
+        components.get_entrypoint("troika.sites", "unknown")
+    with pytest.raises(KeyError):
+        components.get_entrypoint("troika.nonexistent", "direct")
@@ -70,3 +70,21 @@ def test_ssh_parent():
     cfg = {"host": "localhost"}
     conn = connection.get_connection("ssh", cfg, "user")
     assert isinstance(conn.get_parent(), LocalConnection)
+
+
+def test_ssh_control_persist():
+    cfg = {"host": "remote", "ssh_control_persist": "60s"}
+    conn = connection.get_connection("ssh", cfg, "user")
+    for opts in (conn.ssh_options, conn.scp_options):
+        assert "-oControlMaster=auto" in opts
+        assert "-oControlPersist=60s" in opts
+        assert "-oControlPath=~/.ssh/troika-control-%r@%h:%p" in opts
+
+
+def test_checkstatus_timeout(monkeypatch):
+    conn = LocalConnection({}, "user")
+    execute = conn.execute
+    monkeypatch.setattr(
+        conn, "execute", lambda command, **kwargs: execute(["sleep", "10"], **kwargs)
+    )
+    assert conn.checkstatus(timeout=0.1) is False
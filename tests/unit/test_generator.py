@@ -0,0 +1,40 @@
+from troika.generator import Generator, ignore
+
+
+def test_generate():
+    translate = {
+        "name": b"--job-name=%s",
+        "skipped": ignore,
+        "multi": lambda value: [b"-a %s" % value, b"-b %s" % value],
+    }
+    gen = Generator(b"#SBATCH ", translate)
+    script_data = {
+        "shebang": b"#!/bin/bash",
+        "directives": {"name": b"test", "skipped": b"", "multi": b"x"},
+        "native": {b"--foo": (b"bar", b"#SBATCH --foo=bar\n")},
+    }
+    header = b"".join(gen.generate(script_data))
+    assert header == (
+        b"#!/bin/bash\n"
+        b"#SBATCH --job-name=test\n"
+        b"#SBATCH -a x\n"
+        b"#SBATCH -b x\n"
+        b"#SBATCH --foo=bar\n"
+    )
+
+
+def test_generate_no_prefix():
+    gen = Generator(None, {})
+    script_data = {"shebang": b"#!/bin/bash\n", "directives": {"name": b"test"}}
+    assert gen.generate(script_data) == [b"#!/bin/bash\n"]
+
+
+def test_generate_native_grouped():
+    gen = Generator(b"#PBS ", {})
+    script_data = {
+        "native": {
+            b"-N": (b"job", b"#PBS -N job\n"),
+            b"-V": (None, b"#PBS -V\n"),
+        },
+    }
+    assert gen.generate(script_data) == [b"#PBS -N job\n#PBS -V\n"]
@@ -0,0 +1,87 @@
+import pathlib
+from types import SimpleNamespace
+
+import pytest
+
+import troika
+from troika import hook
+from troika.config import Config
+from troika.hooks import common
+from troika.hooks.base import Hook
+from troika.sites.base import Site
+
+
+class DummySite(Site):
+    def __init__(self, working=True):
+        self._connection = object()
+        self.created = []
+        self.working = working
+
+    def check_connection(self, timeout=None, dryrun=False):
+        return self.working
+
+    def create_output_dir(self, output, dryrun=False):
+        out_dir = pathlib.PurePath(output).parent
+        self.created.append((out_dir, dryrun))
+        return out_dir
+
+
+@pytest.fixture
+def dummy_site():
+    common.clear_output_dir_cache()
+    yield DummySite()
+    common.clear_output_dir_cache()
+
+
+def test_ensure_output_dir_cached(dummy_site):
+    out1 = common.ensure_output_dir(dummy_site, "/foo/bar/out1.log")
+    out2 = common.ensure_output_dir(dummy_site, "/foo/bar/out2.log")
+    assert out1 == out2 == pathlib.PurePath("/foo/bar")
+    assert dummy_site.created == [(pathlib.PurePath("/foo/bar"), False)]
+
+    common.ensure_output_dir(dummy_site, "/foo/baz/out.log")
+    assert len(dummy_site.created) == 2
+
+
+def test_ensure_output_dir_dryrun(dummy_site):
+    common.ensure_output_dir(dummy_site, "/foo/bar/out.log", dryrun=True)
+    common.ensure_output_dir(dummy_site, "/foo/bar/out.log", dryrun=True)
+    assert len(dummy_site.created) == 2
+
+
+@pytest.mark.parametrize("working", [True, False])
+def test_check_connection_async(working):
+    site = DummySite(working=working)
+    args = SimpleNamespace(dryrun=False)
+    assert common.check_connection_async("submit", site, args) is None
+    if working:
+        common.ensure_output_dir(site, "/foo/bar/out.log")
+        assert len(site.created) == 1
+    else:
+        with pytest.raises(troika.RunError, match="Connection not working"):
+            common.ensure_output_dir(site, "/foo/bar/out.log")
+        assert site.created == []
+
+
+def test_check_connection_async_other_action():
+    site = DummySite(working=False)
+    args = SimpleNamespace(dryrun=False)
+    assert common.check_connection_async("kill", site, args)
+
+
+def test_setup_hooks_frozen(monkeypatch):
+    monkeypatch.setattr(Hook, "registered_hooks", Hook.registered_hooks.copy())
+    monkeypatch.setattr(Hook, "_frozen", None)
+    frozen = Hook.freeze()
+    assert Hook.freeze() is frozen
+    assert frozen == tuple(Hook.registered_hooks.values())
+
+    @Hook.declare
+    def dummy_hook():
+        """Dummy hook"""
+
+    hooks = Hook.freeze()
+    assert hooks == frozen + (dummy_hook,)
+    hook.setup_hooks(Config({"sites": {"foo": {}}}), "foo")
+    for spec in Hook.registered_hooks.values():
+        assert spec._impl == ()
@@ -3,7 +3,14 @@ import textwrap
 import pytest
 
 from troika import InvocationError
-from troika.parser import DirectiveParser, ParseError
+from troika.parser import (
+    DirectiveParser,
+    MultiParser,
+    ParseError,
+    ShebangParser,
+    load_directives,
+    save_directives,
+)
 
 
 @pytest.mark.parametrize(
@@ -164,3 +171,46 @@ def test_directive_define_error(defines, wrong):
     wrongdir = defines[wrong].encode("ascii")
     with pytest.raises(InvocationError, match=f"Invalid key-value pair: {wrongdir!r}"):
         parser.parse_directive_args(defines)
+
+
+def test_multi_parser():
+    script = """\
+    #!/usr/bin/env bash
+    #TROIKA foo=bar
+    #!not a shebang
+    echo "Hello, World!"
+    #TROIKA spam=eggs
+    """
+    lines = textwrap.dedent(script).encode("ascii").splitlines(keepends=True)
+    parser = MultiParser(
+        [("directives", DirectiveParser()), ("shebang", ShebangParser())]
+    )
+    body = [line for line in lines if not parser.feed(line)]
+    assert parser.data == {
+        "directives": {"foo": b"bar", "spam": b"eggs"},
+        "shebang": b"#!/usr/bin/env bash\n",
+    }
+    assert body == [b"#!not a shebang\n", b'echo "Hello, World!"\n']
+
+
+def test_save_load_directives(tmp_path):
+    path = tmp_path / "script.orig.directives"
+    directives = {"name": b"hello", "spam": b"\xffeggs", "flag": True}
+    save_directives(path, directives)
+    assert load_directives(path) == {"name": b"hello", "spam": b"\xffeggs"}
+
+
+def test_feed_buffer():
+    script = """\
+    #!/usr/bin/env bash
+    #TROIKA foo=bar
+    #  TROIKA spaces = yes 
+    #TROIKA
+    notadirective=1
+    #TROIKA invalid
+    echo "Hello, World!"
+    #TROIKA spam=eggs
+    #TROIKA spam=beans"""  # noqa: W291
+    parser = DirectiveParser()
+    parser.feed_buffer(textwrap.dedent(script).encode("ascii"))
+    assert parser.data == {"foo": b"bar", "spaces": b"yes", "spam": b"beans"}
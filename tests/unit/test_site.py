@@ -64,3 +64,23 @@ def test_get_base():
     cfg = Config({"sites": {"what": {"type": "base", "connection": "local"}}})
     with pytest.raises(troika.ConfigurationError):
         get_site(cfg, "what", "user")
+
+
+def test_directive_translation(dummy_sites, monkeypatch):
+    monkeypatch.setattr(DummySite, "directive_prefix", b"#DUMMY ")
+    monkeypatch.setattr(
+        DummySite, "directive_translate", {"name": b"-N %s", "queue": b"-q %s"}
+    )
+    site_cfg = {
+        "type": "dummy",
+        "connection": "local",
+        "directive_translate": {"queue": "--queue=%s", "name": None},
+    }
+    cfg = Config({"sites": {"foo": site_cfg}})
+    site = get_site(cfg, "foo", "user")
+    prefix, translate = site.get_directive_translation()
+    assert prefix == b"#DUMMY "
+    assert translate["queue"] == b"--queue=%s"
+    assert translate["name"] is troika.generator.ignore
+    assert DummySite.directive_translate["queue"] == b"-q %s"
+    assert site.get_directive_translation() is site.get_directive_translation()